@@ -74,14 +74,20 @@ class Parameter(object):
         deserializer = self.get_dererializer()
         return deserializer(value)
 
+    def has_value(self, request):
+        """Check if request provides the value or optional default applies"""
+        location = self._get_location(request)
+        return self.name in location or (
+            not self.required and self._has_default())
+
     def get_raw_value(self, request):
-        location = request.parameters[self.location.value]
+        location = self._get_location(request)
 
         if self.name not in location:
             if self.required:
                 raise MissingRequiredParameter(self.name)
 
-            if not self.schema or self.schema.default is None:
+            if not self._has_default():
                 raise MissingParameter(self.name)
 
             return self.schema.default
@@ -93,6 +99,12 @@ class Parameter(object):
 
         return location[self.name]
 
+    def _get_location(self, request):
+        return request.parameters[self.location.value]
+
+    def _has_default(self):
+        return bool(self.schema) and self.schema.default is not None
+
     def cast(self, value):
         if self.deprecated:
             warnings.warn(
@@ -1,6 +1,8 @@
 from jsonschema._utils import find_additional_properties, extras_msg
 from jsonschema.exceptions import ValidationError, FormatError
 
+from openapi_core.schema.schemas.util import compile_pattern
+
 
 def type(validator, data_type, instance, schema):
     if instance is None:
@@ -21,6 +23,14 @@ def format(validator, format, instance, schema):
             yield ValidationError(error.message, cause=error.cause)
 
 
+def pattern(validator, patrn, instance, schema):
+    if (
+        validator.is_type(instance, "string") and
+        not compile_pattern(patrn).search(instance)
+    ):
+        yield ValidationError("%r does not match %r" % (instance, patrn))
+
+
 def items(validator, items, instance, schema):
     if not validator.is_type(instance, "array"):
         return
@@ -1,8 +1,6 @@
 """OpenAPI core schemas factories module"""
 import logging
 
-from six import iteritems
-
 from openapi_core.compat import lru_cache
 from openapi_core.schema.properties.generators import PropertiesGenerator
 from openapi_core.schema.schemas.models import Schema
@@ -97,7 +95,7 @@ class SchemaDictFactory(object):
         Contribution('type', src_prop_attr='value'),
         Contribution('format'),
         Contribution('properties', is_dict=True, dest_default={}),
-        Contribution('required', dest_default=[]),
+        Contribution('required', dest_default=()),
         Contribution('default'),
         Contribution('nullable', dest_default=False),
         Contribution('all_of', dest_prop_name='allOf', is_list=True, dest_default=[]),
@@ -126,7 +124,7 @@ class SchemaDictFactory(object):
 
     def _contribute(self, schema, schema_dict, contrib):
         def src_map(x):
-            return getattr(x, '__dict__')
+            return x.as_dict()
         src_val = getattr(schema, contrib.src_prop_name)
 
         if src_val and contrib.src_prop_attr:
@@ -137,7 +135,7 @@ class SchemaDictFactory(object):
         if contrib.is_dict:
             src_val = dict(
                 (k, src_map(v))
-                for k, v in iteritems(src_val)
+                for k, v in src_val.items()
             )
 
         if src_val == contrib.dest_default:
@@ -1,8 +1,6 @@
 """OpenAPI core schemas generators module"""
 import logging
 
-from six import iteritems
-
 log = logging.getLogger(__name__)
 
 
@@ -15,6 +13,6 @@ class SchemasGenerator(object):
     def generate(self, schemas_spec):
         schemas_deref = self.dereferencer.dereference(schemas_spec)
 
-        for schema_name, schema_spec in iteritems(schemas_deref):
+        for schema_name, schema_spec in schemas_deref.items():
             schema, _ = self.schemas_registry.get_or_create(schema_spec)
             yield schema_name, schema
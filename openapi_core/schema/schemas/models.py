@@ -2,14 +2,11 @@
 import attr
 import functools
 import logging
-from collections import defaultdict
 from datetime import date, datetime
 from uuid import UUID
-import re
 import warnings
 
-from six import iteritems, integer_types, binary_type, text_type
-from jsonschema.exceptions import ValidationError
+from six import integer_types, binary_type, text_type
 
 from openapi_core.extensions.models.factories import ModelFactory
 from openapi_core.schema.schemas._format import oas30_format_checker
@@ -18,15 +15,23 @@ from openapi_core.schema.schemas.exceptions import (
     CastError, InvalidSchemaValue,
     UnmarshallerError, UnmarshalValueError, UnmarshalError,
 )
+from openapi_core.schema.schemas.unmarshallers import (
+    StringUnmarshaller, BooleanUnmarshaller, IntegerUnmarshaller,
+    NumberUnmarshaller,
+)
 from openapi_core.schema.schemas.util import (
-    forcebool, format_date, format_datetime, format_byte, format_uuid,
-    format_number,
+    compile_pattern, forcebool, format_date, format_datetime, format_byte,
+    format_uuid, format_number,
 )
 from openapi_core.schema.schemas.validators import OAS30Validator
 
 log = logging.getLogger(__name__)
 
 
+def _identity(x):
+    return x
+
+
 @attr.s
 class Format(object):
     unmarshal = attr.ib()
@@ -36,6 +41,23 @@ class Format(object):
 class Schema(object):
     """Represents an OpenAPI Schema."""
 
+    __slots__ = (
+        'type', 'model', 'properties', 'items', 'format', 'required',
+        'default', 'nullable', 'enum', 'deprecated', 'all_of', 'one_of',
+        'additional_properties', 'min_items', 'max_items', 'min_length',
+        'max_length', 'pattern', 'unique_items', 'minimum', 'maximum',
+        'multiple_of', 'exclusive_minimum', 'exclusive_maximum',
+        'min_properties', 'max_properties',
+        '_all_properties_cache', '_all_properties_names_cache',
+        '_all_required_properties_cache',
+        '_all_required_properties_names_cache',
+        '_all_optional_properties_cache', '_validator', '_validator_resolver',
+        '_cast_mapping', '_cast_callable', '_unmarshal_mapping_cache',
+        '_unmarshal_callable_cache', '_custom_formatters',
+        '_custom_unmarshal_mapping_cache', '_custom_unmarshal_callable_cache',
+        '_primitive_unmarshallers_base', '_source',
+    )
+
     TYPE_CAST_CALLABLE_GETTER = {
         SchemaType.INTEGER: int,
         SchemaType.NUMBER: float,
@@ -45,6 +67,11 @@ class Schema(object):
     DEFAULT_UNMARSHAL_CALLABLE_GETTER = {
     }
 
+    _TYPES_RESOLVE_ORDER = (
+        SchemaType.OBJECT, SchemaType.ARRAY, SchemaType.BOOLEAN,
+        SchemaType.INTEGER, SchemaType.NUMBER, SchemaType.STRING,
+    )
+
     def __init__(
             self, schema_type=None, model=None, properties=None, items=None,
             schema_format=None, required=None, default=None, nullable=False,
@@ -56,22 +83,22 @@ class Schema(object):
             min_properties=None, max_properties=None, _source=None):
         self.type = SchemaType(schema_type)
         self.model = model
-        self.properties = properties and dict(properties) or {}
+        self.properties = dict(properties) if properties else {}
         self.items = items
         self.format = schema_format
-        self.required = required or []
+        self.required = tuple(required) if required else ()
         self.default = default
         self.nullable = nullable
         self.enum = enum
         self.deprecated = deprecated
-        self.all_of = all_of and list(all_of) or []
-        self.one_of = one_of and list(one_of) or []
+        self.all_of = list(all_of) if all_of else []
+        self.one_of = list(one_of) if one_of else []
         self.additional_properties = additional_properties
         self.min_items = int(min_items) if min_items is not None else None
         self.max_items = int(max_items) if max_items is not None else None
         self.min_length = int(min_length) if min_length is not None else None
         self.max_length = int(max_length) if max_length is not None else None
-        self.pattern = pattern and re.compile(pattern) or None
+        self.pattern = compile_pattern(pattern) if pattern else None
         self.unique_items = unique_items
         self.minimum = int(minimum) if minimum is not None else None
         self.maximum = int(maximum) if maximum is not None else None
@@ -84,13 +111,25 @@ class Schema(object):
         self.max_properties = int(max_properties)\
             if max_properties is not None else None
 
+        self._all_properties_cache = None
+        self._all_properties_names_cache = None
         self._all_required_properties_cache = None
+        self._all_required_properties_names_cache = None
         self._all_optional_properties_cache = None
+        self._validator = None
+        self._validator_resolver = None
+        self._cast_mapping = None
+        self._cast_callable = self._get_cast_callable()
+        self._unmarshal_mapping_cache = {}
+        self._unmarshal_callable_cache = {}
+        self._custom_formatters = None
+        self._custom_unmarshal_mapping_cache = {}
+        self._custom_unmarshal_callable_cache = {}
+        self._primitive_unmarshallers_base = None
 
         self._source = _source
 
-    @property
-    def __dict__(self):
+    def as_dict(self):
         return self._source or self.to_dict()
 
     def to_dict(self):
@@ -101,17 +140,30 @@ class Schema(object):
         return self.properties[name]
 
     def get_all_properties(self):
+        return self._get_all_properties().copy()
+
+    def _get_all_properties(self):
+        # cached flattened properties; must not be mutated
+        if self._all_properties_cache is None:
+            self._all_properties_cache = self._build_all_properties()
+
+        return self._all_properties_cache
+
+    def _build_all_properties(self):
         properties = self.properties.copy()
 
         for subschema in self.all_of:
-            subschema_props = subschema.get_all_properties()
+            subschema_props = subschema._get_all_properties()
             properties.update(subschema_props)
 
         return properties
 
     def get_all_properties_names(self):
-        all_properties = self.get_all_properties()
-        return set(all_properties.keys())
+        if self._all_properties_names_cache is None:
+            all_properties = self._get_all_properties()
+            self._all_properties_names_cache = frozenset(all_properties)
+
+        return self._all_properties_names_cache
 
     def get_all_required_properties(self):
         if self._all_required_properties_cache is None:
@@ -121,51 +173,120 @@ class Schema(object):
         return self._all_required_properties_cache
 
     def _get_all_required_properties(self):
-        all_properties = self.get_all_properties()
-        required = self.get_all_required_properties_names()
+        all_properties = self._get_all_properties()
 
-        return dict(
-            (prop_name, val)
-            for prop_name, val in iteritems(all_properties)
-            if prop_name in required
-        )
+        return {
+            prop_name: all_properties[prop_name]
+            for prop_name in self.get_all_required_properties_names()
+            if prop_name in all_properties
+        }
 
     def get_all_required_properties_names(self):
-        required = self.required[:]
+        if self._all_required_properties_names_cache is None:
+            self._all_required_properties_names_cache =\
+                self._get_all_required_properties_names()
+
+        return self._all_required_properties_names_cache
+
+    def _get_all_required_properties_names(self):
+        required = set(self.required)
 
         for subschema in self.all_of:
             subschema_req = subschema.get_all_required_properties()
-            required += subschema_req
+            required.update(subschema_req)
 
-        return set(required)
+        return frozenset(required)
 
     def get_cast_mapping(self):
-        mapping = self.TYPE_CAST_CALLABLE_GETTER.copy()
-        mapping.update({
-            SchemaType.ARRAY: self._cast_collection,
-        })
+        if self._cast_mapping is None:
+            mapping = self.TYPE_CAST_CALLABLE_GETTER.copy()
+            mapping.update({
+                SchemaType.ARRAY: self._cast_collection,
+            })
+            self._cast_mapping = mapping
 
-        return defaultdict(lambda: lambda x: x, mapping)
+        return self._cast_mapping
+
+    def _get_cast_callable(self):
+        if self.type is SchemaType.ARRAY:
+            return self._cast_collection
+
+        return self.TYPE_CAST_CALLABLE_GETTER.get(self.type, _identity)
 
     def cast(self, value):
         """Cast value from string to schema type"""
-        if value is None:
+        if value is None or self._cast_callable is _identity:
             return value
 
-        cast_mapping = self.get_cast_mapping()
-
-        cast_callable = cast_mapping[self.type]
         try:
-            return cast_callable(value)
+            return self._cast_callable(value)
         except ValueError:
             raise CastError(value, self.type)
 
+    def cast_many(self, values):
+        """Cast sequence of values from string to schema type"""
+        values = list(values)
+        cast_callable = self._cast_callable
+        if cast_callable is _identity:
+            return values
+
+        try:
+            return [
+                None if value is None else cast_callable(value)
+                for value in values
+            ]
+        except ValueError:
+            # cast one by one to report the invalid value
+            return list(map(self.cast, values))
+
     def _cast_collection(self, value):
-        return list(map(self.items.cast, value))
+        return self.items.cast_many(value)
 
     def get_unmarshal_mapping(self, custom_formatters=None, strict=True):
-        primitive_unmarshallers = self.get_primitive_unmarshallers(
-            custom_formatters=custom_formatters)
+        mapping_cache, _ = self._get_unmarshal_caches(custom_formatters)
+        try:
+            return mapping_cache[strict]
+        except KeyError:
+            mapping = self._get_unmarshal_mapping(
+                custom_formatters=custom_formatters, strict=strict)
+            mapping_cache[strict] = mapping
+            return mapping
+
+    def get_unmarshal_callable(self, custom_formatters=None, strict=True):
+        # resolved once per strict to avoid hashing the type enum per call
+        _, callable_cache = self._get_unmarshal_caches(custom_formatters)
+        try:
+            return callable_cache[strict]
+        except KeyError:
+            unmarshal_mapping = self.get_unmarshal_mapping(
+                custom_formatters=custom_formatters, strict=strict)
+            unmarshal_callable = unmarshal_mapping.get(self.type, _identity)
+            callable_cache[strict] = unmarshal_callable
+            return unmarshal_callable
+
+    def _get_unmarshal_caches(self, custom_formatters):
+        if custom_formatters is None:
+            return (
+                self._unmarshal_mapping_cache, self._unmarshal_callable_cache)
+
+        # single slot for the last custom formatters object keeps the caches
+        # bounded; validators pass the same object on every call
+        if custom_formatters is not self._custom_formatters:
+            self._custom_formatters = custom_formatters
+            self._custom_unmarshal_mapping_cache = {}
+            self._custom_unmarshal_callable_cache = {}
+
+        return (
+            self._custom_unmarshal_mapping_cache,
+            self._custom_unmarshal_callable_cache,
+        )
+
+    def _get_unmarshal_mapping(self, custom_formatters=None, strict=True):
+        if custom_formatters is None:
+            primitive_unmarshallers = self._get_primitive_unmarshallers_base()
+        else:
+            primitive_unmarshallers = self.get_primitive_unmarshallers(
+                custom_formatters=custom_formatters)
 
         primitive_unmarshallers_partial = dict(
             (t, functools.partial(u, type_format=self.format, strict=strict))
@@ -182,20 +303,25 @@ class Schema(object):
             SchemaType.OBJECT: pass_defaults(self._unmarshal_object),
         })
 
-        return defaultdict(lambda: lambda x: x, mapping)
+        return mapping
 
     def get_validator(self, resolver=None):
-        return OAS30Validator(
-            self.__dict__, resolver=resolver, format_checker=oas30_format_checker)
+        # keep only the last resolver's validator so the cache stays bounded;
+        # in practice it is always the spec's resolver
+        if self._validator is None or self._validator_resolver is not resolver:
+            self._validator = OAS30Validator(
+                self.as_dict(), resolver=resolver,
+                format_checker=oas30_format_checker)
+            self._validator_resolver = resolver
+
+        return self._validator
 
     def validate(self, value, resolver=None):
         validator = self.get_validator(resolver=resolver)
-        try:
-            return validator.validate(value)
-        except ValidationError:
-            errors_iter = validator.iter_errors(value)
+        errors = list(validator.iter_errors(value))
+        if errors:
             raise InvalidSchemaValue(
-                value, self.type, schema_errors_iter=errors_iter)
+                value, self.type, schema_errors_iter=iter(errors))
 
     def unmarshal(self, value, custom_formatters=None, strict=True):
         """Unmarshal parameter from the value."""
@@ -210,13 +336,11 @@ class Schema(object):
         if self.enum and value not in self.enum:
             raise UnmarshalError("Invalid value for enum: {0}".format(value))
 
-        unmarshal_mapping = self.get_unmarshal_mapping(
-            custom_formatters=custom_formatters, strict=strict)
-
         if self.type is not SchemaType.STRING and value == '':
             return None
 
-        unmarshal_callable = unmarshal_mapping[self.type]
+        unmarshal_callable = self.get_unmarshal_callable(
+            custom_formatters=custom_formatters, strict=strict)
         try:
             unmarshalled = unmarshal_callable(value)
         except ValueError as exc:
@@ -225,11 +349,6 @@ class Schema(object):
         return unmarshalled
 
     def get_primitive_unmarshallers(self, **options):
-        from openapi_core.schema.schemas.unmarshallers import (
-            StringUnmarshaller, BooleanUnmarshaller, IntegerUnmarshaller,
-            NumberUnmarshaller,
-        )
-
         unmarshallers_classes = {
             SchemaType.STRING: StringUnmarshaller,
             SchemaType.BOOLEAN: BooleanUnmarshaller,
@@ -244,12 +363,15 @@ class Schema(object):
 
         return unmarshallers
 
+    def _get_primitive_unmarshallers_base(self):
+        # shared by strict and non-strict mappings without custom formatters
+        if self._primitive_unmarshallers_base is None:
+            self._primitive_unmarshallers_base =\
+                self.get_primitive_unmarshallers(custom_formatters=None)
+
+        return self._primitive_unmarshallers_base
+
     def _unmarshal_any(self, value, custom_formatters=None, strict=True):
-        types_resolve_order = [
-            SchemaType.OBJECT, SchemaType.ARRAY, SchemaType.BOOLEAN,
-            SchemaType.INTEGER, SchemaType.NUMBER, SchemaType.STRING,
-        ]
-        unmarshal_mapping = self.get_unmarshal_mapping()
         if self.one_of:
             result = None
             for subschema in self.one_of:
@@ -268,8 +390,10 @@ class Schema(object):
 
             return result
         else:
-            for schema_type in types_resolve_order:
-                unmarshal_callable = unmarshal_mapping[schema_type]
+            unmarshal_mapping = self.get_unmarshal_mapping()
+            for schema_type in self._TYPES_RESOLVE_ORDER:
+                unmarshal_callable = unmarshal_mapping.get(
+                    schema_type, _identity)
                 try:
                     return unmarshal_callable(value)
                 except (UnmarshalError, ValueError):
@@ -320,12 +444,13 @@ class Schema(object):
 
     def _unmarshal_properties(self, value, one_of_schema=None,
                               custom_formatters=None, strict=True):
-        all_props = self.get_all_properties()
+        all_props = self._get_all_properties()
         all_props_names = self.get_all_properties_names()
         all_req_props_names = self.get_all_required_properties_names()
 
         if one_of_schema is not None:
-            all_props.update(one_of_schema.get_all_properties())
+            all_props = all_props.copy()
+            all_props.update(one_of_schema._get_all_properties())
             all_props_names |= one_of_schema.\
                 get_all_properties_names()
             all_req_props_names |= one_of_schema.\
@@ -341,7 +466,7 @@ class Schema(object):
                 properties[prop_name] = self.additional_properties.unmarshal(
                     prop_value, custom_formatters=custom_formatters)
 
-        for prop_name, prop in iteritems(all_props):
+        for prop_name, prop in all_props.items():
             try:
                 prop_value = value[prop_name]
             except KeyError:
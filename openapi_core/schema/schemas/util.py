@@ -3,10 +3,13 @@ from base64 import b64decode
 import datetime
 from distutils.util import strtobool
 from json import dumps
+import re
 from six import string_types, text_type, integer_types
 import strict_rfc3339
 from uuid import UUID
 
+from openapi_core.compat import lru_cache
+
 
 def forcebool(val):
     if isinstance(val, string_types):
@@ -15,6 +18,14 @@ def forcebool(val):
     return bool(val)
 
 
+# Shared by schema models and the pattern validator, so a spec pattern is
+# compiled once. Keep the number of distinct spec patterns under maxsize
+# or the least recently used ones are recompiled.
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern):
+    return re.compile(pattern)
+
+
 def dicthash(d):
     return hash(dumps(d, sort_keys=True))
 
@@ -15,7 +15,8 @@ BaseOAS30Validator = create(
         u"minimum": _legacy_validators.minimum_draft3_draft4,
         u"maxLength": _validators.maxLength,
         u"minLength": _validators.minLength,
-        u"pattern": _validators.pattern,
+        # adjusted to share compiled patterns
+        u"pattern": oas_validators.pattern,
         u"maxItems": _validators.maxItems,
         u"minItems": _validators.minItems,
         u"uniqueItems": _validators.uniqueItems,
@@ -3,15 +3,19 @@ from six import iteritems
 
 
 class Server(object):
+    """Represents an OpenAPI Server."""
 
     def __init__(self, url, variables=None, description=None):
         self.url = url
         self.variables = variables and dict(variables) or {}
         self.description = description
 
+        # computed from the variable defaults given at construction
+        self._default_url = self.get_url()
+
     @property
     def default_url(self):
-        return self.get_url()
+        return self._default_url
 
     @property
     def default_variables(self):
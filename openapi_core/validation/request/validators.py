@@ -69,13 +69,17 @@ class RequestValidator(object):
                 # e.g. overriden path item paremeter on operation
                 continue
             seen.add((param_name, param.location.value))
+
+            # skip absent optional parameter without raising and catching
+            # MissingParameter on the common path
+            if not param.required and not param.has_value(request):
+                continue
+
             try:
                 raw_value = param.get_raw_value(request)
             except MissingRequiredParameter as exc:
                 errors.append(exc)
                 continue
-            except OpenAPIParameterError:
-                continue
 
             try:
                 casted = param.cast(raw_value)
@@ -158,8 +158,8 @@ class TestPetstore(object):
                         assert type(media_type.schema) == Schema
                         assert media_type.schema.type.value ==\
                             schema_spec['type']
-                        assert media_type.schema.required == schema_spec.get(
-                            'required', [])
+                        assert media_type.schema.required == tuple(
+                            schema_spec.get('required', []))
 
                     for parameter_name, parameter in iteritems(
                             response.headers):
@@ -218,8 +218,8 @@ class TestPetstore(object):
                         schema_spec['type']
                     assert media_type.schema.format ==\
                         schema_spec.get('format')
-                    assert media_type.schema.required == schema_spec.get(
-                        'required', False)
+                    assert media_type.schema.required == tuple(
+                        schema_spec.get('required', []))
 
         if not spec.components:
             return
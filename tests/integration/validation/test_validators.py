@@ -91,6 +91,23 @@ class TestRequestValidator(object):
             },
         )
 
+    def test_absent_optional_parameters(self, validator):
+        request = MockRequest(
+            self.host_url, 'get', '/v1/pets',
+            path_pattern='/v1/pets', args={'limit': '10'},
+        )
+
+        result = validator.validate(request)
+
+        assert result.errors == []
+        assert result.parameters == RequestParameters(
+            query={
+                'limit': 10,
+                'page': 1,
+                'search': '',
+            },
+        )
+
     def test_get_pets(self, validator):
         request = MockRequest(
             self.host_url, 'get', '/v1/pets',
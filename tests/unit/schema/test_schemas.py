@@ -7,11 +7,13 @@ import pytest
 from openapi_core.extensions.models.models import Model
 from openapi_core.schema.schemas.enums import SchemaFormat, SchemaType
 from openapi_core.schema.schemas.exceptions import (
-    InvalidSchemaValue, OpenAPISchemaError, UnmarshallerStrictTypeError,
+    CastError, InvalidSchemaValue, OpenAPISchemaError,
+    UnmarshallerStrictTypeError,
     UnmarshalValueError, UnmarshalError, InvalidCustomFormatSchemaValue,
     FormatterNotFoundError,
 )
 from openapi_core.schema.schemas.models import Schema
+from openapi_core.schema.schemas.util import compile_pattern
 
 from six import b, u
 
@@ -355,6 +357,18 @@ class TestSchemaValidate(object):
 
         assert result is None
 
+    def test_all_errors(self):
+        schema = Schema('object', properties={
+            'id': Schema('integer'),
+            'count': Schema('integer'),
+        })
+        value = {'id': u('1'), 'count': u('2')}
+
+        with pytest.raises(InvalidSchemaValue) as exc_info:
+            schema.validate(value)
+
+        assert len(exc_info.value.schema_errors) == 2
+
     @pytest.mark.xfail(
         reason="validation does not care about custom formats atm")
     def test_string_format_custom_missing(self):
@@ -1064,3 +1078,274 @@ class TestSchemaValidate(object):
 
         with pytest.raises(Exception):
             schema.validate(value)
+
+
+class TestSchemaGetValidator(object):
+
+    def test_cached(self):
+        schema = Schema('string')
+
+        validator = schema.get_validator()
+
+        assert schema.get_validator() is validator
+
+    def test_rebuilt_on_resolver_change(self):
+        schema = Schema('string')
+        resolver = mock.sentinel.resolver
+
+        validator = schema.get_validator()
+        resolver_validator = schema.get_validator(resolver=resolver)
+
+        assert resolver_validator is not validator
+        assert schema.get_validator(resolver=resolver) is resolver_validator
+        assert schema.get_validator() is not validator
+
+
+class TestSchemaMappings(object):
+
+    def test_cast_mapping_cached(self):
+        schema = Schema('array', items=Schema('integer'))
+
+        mapping = schema.get_cast_mapping()
+
+        assert schema.get_cast_mapping() is mapping
+
+    def test_unmarshal_mapping_cached(self):
+        schema = Schema('string')
+
+        mapping = schema.get_unmarshal_mapping()
+
+        assert schema.get_unmarshal_mapping() is mapping
+        assert schema.get_unmarshal_mapping(strict=False) is not mapping
+
+    def test_unmarshal_mapping_custom_formatters_cached(self):
+        schema = Schema('string')
+        custom_formatters = {}
+
+        mapping = schema.get_unmarshal_mapping(
+            custom_formatters=custom_formatters)
+
+        assert schema.get_unmarshal_mapping(
+            custom_formatters=custom_formatters) is mapping
+
+    def test_unmarshal_mapping_custom_formatters_rebuilt_on_change(self):
+        schema = Schema('string')
+
+        mapping = schema.get_unmarshal_mapping(custom_formatters={})
+
+        assert schema.get_unmarshal_mapping(
+            custom_formatters={}) is not mapping
+        assert len(schema._custom_unmarshal_mapping_cache) == 1
+
+    def test_unmarshal_mapping_shares_primitive_unmarshallers(self):
+        schema = Schema('string')
+
+        with mock.patch.object(
+                Schema, 'get_primitive_unmarshallers',
+                wraps=schema.get_primitive_unmarshallers) as mock_get:
+            schema.get_unmarshal_mapping(strict=True)
+            schema.get_unmarshal_mapping(strict=False)
+
+        mock_get.assert_called_once_with(custom_formatters=None)
+
+    def test_unmarshal_callable_cached(self):
+        schema = Schema('integer')
+
+        unmarshal_callable = schema.get_unmarshal_callable()
+
+        assert schema.get_unmarshal_callable() is unmarshal_callable
+        assert unmarshal_callable is schema.get_unmarshal_mapping()[
+            SchemaType.INTEGER]
+
+    def test_unmarshal_callable_custom_formatters_cached(self):
+        schema = Schema('integer')
+        custom_formatters = {}
+
+        unmarshal_callable = schema.get_unmarshal_callable(
+            custom_formatters=custom_formatters)
+
+        assert schema.get_unmarshal_callable(
+            custom_formatters=custom_formatters) is unmarshal_callable
+        assert schema.get_unmarshal_callable(
+            custom_formatters={}) is not unmarshal_callable
+        assert len(schema._custom_unmarshal_callable_cache) == 1
+
+
+class TestSchemaAllProperties(object):
+
+    @pytest.fixture
+    def schema(self):
+        return Schema(
+            'object',
+            properties={'id': Schema('integer')},
+            required=['id'],
+            all_of=[
+                Schema(
+                    'object',
+                    properties={'name': Schema('string')},
+                    required=['name'],
+                ),
+                Schema('object', properties={'tag': Schema('string')}),
+            ],
+        )
+
+    def test_all_properties(self, schema):
+        result = schema.get_all_properties()
+
+        assert set(result) == set(['id', 'name', 'tag'])
+
+    def test_all_properties_copy(self, schema):
+        result = schema.get_all_properties()
+        result['extra'] = Schema('string')
+
+        assert 'extra' not in schema.get_all_properties()
+        assert result is not schema.get_all_properties()
+
+    def test_all_properties_names(self, schema):
+        result = schema.get_all_properties_names()
+
+        assert result == frozenset(['id', 'name', 'tag'])
+        assert schema.get_all_properties_names() is result
+
+    def test_all_required_properties_names(self, schema):
+        result = schema.get_all_required_properties_names()
+
+        assert result == frozenset(['id', 'name'])
+        assert schema.get_all_required_properties_names() is result
+
+    def test_unmarshal_one_of_keeps_cache(self):
+        schema = Schema(
+            'object',
+            properties={'id': Schema('integer')},
+            one_of=[
+                Schema('object', properties={'name': Schema('string')}),
+            ],
+        )
+
+        result = schema.unmarshal({'id': 1, 'name': 'foo'})
+
+        assert result.id == 1
+        assert result.name == 'foo'
+        assert set(schema.get_all_properties()) == set(['id'])
+
+
+class TestSchemaCast(object):
+
+    def test_none(self):
+        schema = Schema('integer')
+
+        result = schema.cast(None)
+
+        assert result is None
+
+    def test_string(self):
+        schema = Schema('string')
+        value = '123'
+
+        result = schema.cast(value)
+
+        assert result is value
+
+    def test_integer(self):
+        schema = Schema('integer')
+
+        result = schema.cast('123')
+
+        assert result == 123
+
+    def test_integer_invalid(self):
+        schema = Schema('integer')
+
+        with pytest.raises(CastError):
+            schema.cast('abc')
+
+    def test_array(self):
+        schema = Schema('array', items=Schema('number'))
+
+        result = schema.cast(['1', '2.5'])
+
+        assert result == [1.0, 2.5]
+
+    def test_array_invalid(self):
+        schema = Schema('array', items=Schema('integer'))
+
+        with pytest.raises(CastError) as exc_info:
+            schema.cast(['1', 'abc'])
+
+        assert exc_info.value.value == 'abc'
+
+    def test_many_with_none(self):
+        schema = Schema('integer')
+
+        result = schema.cast_many(['1', None, '3'])
+
+        assert result == [1, None, 3]
+
+    def test_many_string(self):
+        schema = Schema('string')
+        values = ('a', 'b')
+
+        result = schema.cast_many(values)
+
+        assert result == ['a', 'b']
+
+    def test_many_iterator(self):
+        schema = Schema('integer')
+
+        result = schema.cast_many(iter(['1', '2']))
+
+        assert result == [1, 2]
+
+
+class TestSchemaPattern(object):
+
+    def test_shared_with_validator(self):
+        schema = Schema('string', pattern='^[a-z]+$')
+
+        assert schema.pattern is compile_pattern('^[a-z]+$')
+
+    @pytest.mark.parametrize('value', [u('foo'), u('bar')])
+    def test_valid(self, value):
+        schema = Schema('string', pattern='^[a-z]+$')
+
+        result = schema.validate(value)
+
+        assert result is None
+
+    @pytest.mark.parametrize('value', [u('Foo'), u('123')])
+    def test_invalid(self, value):
+        schema = Schema('string', pattern='^[a-z]+$')
+
+        with pytest.raises(InvalidSchemaValue):
+            schema.validate(value)
+
+
+class TestSchemaAsDict(object):
+
+    def test_source(self):
+        source = {'type': 'string'}
+        schema = Schema('string', _source=source)
+
+        result = schema.as_dict()
+
+        assert result is source
+
+    def test_no_source(self):
+        schema = Schema(
+            'object', properties={'name': Schema('string')},
+            required=['name'],
+        )
+
+        result = schema.as_dict()
+
+        assert result == {
+            'type': 'object',
+            'properties': {'name': {'type': 'string'}},
+            'required': ('name', ),
+        }
+
+    def test_no_instance_dict(self):
+        schema = Schema('string')
+
+        with pytest.raises(AttributeError):
+            schema.undefined = True
@@ -0,0 +1,40 @@
+import mock
+import pytest
+
+from openapi_core.schema.servers.models import Server, ServerVariable
+
+
+class TestServerDefaultUrl(object):
+
+    @pytest.fixture
+    def server(self):
+        variables = {
+            'port': ServerVariable('port', '8443', enum=['8443', '443']),
+            'basePath': ServerVariable('basePath', 'v2'),
+        }
+        return Server(
+            'https://petstore.swagger.io:{port}/{basePath}',
+            variables=variables,
+        )
+
+    def test_variable_defaults(self, server):
+        assert server.default_url == 'https://petstore.swagger.io:8443/v2'
+
+    def test_computed_once(self):
+        with mock.patch.object(
+                Server, 'get_url', return_value='http://localhost',
+        ) as mock_get_url:
+            server = Server('http://localhost')
+            server.default_url
+            server.default_url
+
+        mock_get_url.assert_called_once_with()
+
+    def test_get_url_variables(self, server):
+        result = server.get_url(port='443', basePath='v1')
+
+        assert result == 'https://petstore.swagger.io:443/v1'
+
+    def test_undeclared_variable(self):
+        with pytest.raises(KeyError):
+            Server('https://petstore.swagger.io/{basePath}')